@@ -2,7 +2,7 @@
 import time, threading
 
 # Import python types
-from typing import NamedTuple, Optional, Dict
+from typing import NamedTuple, Optional, Dict, List, Tuple
 
 # Import device utilities
 from device.utilities import bitwise, logger
@@ -11,8 +11,8 @@ from device.utilities.communication.i2c.exceptions import I2CError
 from device.utilities.communication.i2c.mux_simulator import MuxSimulator
 
 # Import driver elements
-from device.peripherals.common.pca9633.simulator import PCA9633Simulator
-from device.peripherals.common.pca9633 import exceptions
+from device.peripherals.common.adt7470.simulator import ADT7470Simulator
+from device.peripherals.common.adt7470 import exceptions
 
 # Define identification registers
 VERSION_REGISTER = 0x3F
@@ -33,8 +33,17 @@ PWM_CURRENT_DUTY_CYCLE_BASE_REGISTER = 0x32
 THERMAL_ZONE_CONFIG_BASE_REGISTER = 0x7C
 THERMAL_ZONE_MINIMUM_TEMPERATURE_BASE_REGISTER = 0x6E
 TACHOMETER_BASE_REGISTER = 0x2A
+TACHOMETER_MINIMUM_BASE_REGISTER = 0x58
 FAN_PULSES_PER_REVOLUTION_REGISTER = 0x43
 
+# Define interrupt status registers, fan alarm bits are 4-7 of status register 2
+INTERRUPT_STATUS_REGISTER_1 = 0x41
+INTERRUPT_STATUS_REGISTER_2 = 0x42
+
+# Define register block sizes
+NUM_TEMPERATURE_SENSORS = 10
+NUM_FANS = 4
+
 
 class ADT7470Driver:
     """Driver for ADT7470 temperature sensor hub and fan controller."""
@@ -62,7 +71,7 @@ class ADT7470Driver:
         # Check if simulating
         if simulate:
             self.logger.info("Simulating driver")
-            Simulator = PCA9633Simulator
+            Simulator = ADT7470Simulator
         else:
             Simulator = None
 
@@ -207,7 +216,7 @@ class ADT7470Driver:
                 )
                 self.i2c.write_register(register_address, temperature_byte)
             except I2CError as e:
-                raise exceptions.WriteThermalZoneMinimumTemperature(
+                raise exceptions.WriteThermalZoneMinimumTemperatureError(
                     logger=self.logger
                 ) from e
 
@@ -422,6 +431,66 @@ class ADT7470Driver:
             self.logger.debug("Temperature: {}".format(temperature))
             return temperature
 
+    def read_all_temperatures(self) -> List[float]:
+        """Reads all temperature sensors in a single block read. Does not reset the
+        monitor so values are from the latest monitoring cycle."""
+        self.logger.debug("Reading all temperatures")
+
+        # Read temperature register block
+        with self.i2c_lock:
+            try:
+                self.i2c.write(bytes([TEMPERATURE_BASE_REGISTER]))
+                bytes_ = self.i2c.read(NUM_TEMPERATURE_SENSORS)
+            except I2CError as e:
+                raise exceptions.ReadTemperaturesError(logger=self.logger) from e
+
+        # Convert temperature bytes to floats
+        temperatures = []
+        for temperature_byte in bytes_:
+            if temperature_byte > 127:
+                temperatures.append(float(temperature_byte - 256))
+            else:
+                temperatures.append(float(temperature_byte))
+
+        # Return temperature values
+        self.logger.debug("Temperatures: {}".format(temperatures))
+        return temperatures
+
+    def read_all_fan_status(self) -> Tuple[List[float], List[float]]:
+        """Reads tachometer and current duty cycle registers for all fans in a single 
+        block read. Tachometer and duty cycle registers are contiguous and low bytes 
+        are read before high bytes. Returns duty cycles and fan speeds."""
+        self.logger.debug("Reading all fan status")
+
+        # Read tachometer and current duty cycle register block
+        with self.i2c_lock:
+            try:
+                self.i2c.write(bytes([TACHOMETER_BASE_REGISTER]))
+                bytes_ = self.i2c.read(3 * NUM_FANS)
+            except I2CError as e:
+                raise exceptions.ReadFanStatusError(logger=self.logger) from e
+
+        # Convert tachometer words to fan speeds
+        fan_speeds = []
+        for fan_id in range(NUM_FANS):
+            low_byte = bytes_[2 * fan_id]
+            high_byte = bytes_[2 * fan_id + 1]
+            tachometer_word = (high_byte << 8) + low_byte
+            if tachometer_word == 0xFFFF or tachometer_word == 0:
+                fan_speeds.append(0.0)
+            else:
+                fan_speeds.append(round(90000 * 60 / tachometer_word, 1))
+
+        # Convert duty cycle bytes to duty cycles
+        duty_cycles = []
+        for register_byte in bytes_[2 * NUM_FANS :]:
+            duty_cycles.append(round(0.392 * register_byte, 1))
+
+        # Return duty cycles and fan speeds
+        message = "Duty cycles: {}, Fan speeds: {}".format(duty_cycles, fan_speeds)
+        self.logger.debug(message)
+        return duty_cycles, fan_speeds
+
     def read_maximum_temperature(self, retry: bool = True) -> float:
         """Reads the maximum temperature of all sensors."""
         self.logger.debug("Reading maximum temperature")
@@ -445,6 +514,49 @@ class ADT7470Driver:
         self.logger.debug("Max Temperature: {}".format(max_temperature))
         return max_temperature
 
+    def write_fan_minimum_speed(self, fan_id: int, fan_speed_rpm: float) -> None:
+        """Writes the minimum fan speed for a fan. Fans spinning slower than the
+        minimum speed set their alarm bit in the interrupt status registers."""
+        self.logger.debug("Writing minimum fan speed for fan {}".format(fan_id))
+
+        # Validate fan id
+        if fan_id < 0 or fan_id > 3:
+            raise ValueError("Fan id must be a value between 0-3")
+
+        # Validate fan speed
+        if fan_speed_rpm < 83 or fan_speed_rpm > 5400000:
+            raise ValueError("Fan speed must be a value between 83-5400000 RPM")
+
+        # Convert fan speed to tachometer word
+        tachometer_word = int(90000 * 60 / fan_speed_rpm)
+
+        # Write tachometer limit, low byte first
+        with self.i2c_lock:
+            try:
+                low_address = TACHOMETER_MINIMUM_BASE_REGISTER + 2 * fan_id
+                self.i2c.write_register(low_address, tachometer_word & 0xFF)
+                self.i2c.write_register(low_address + 1, tachometer_word >> 8)
+            except I2CError as e:
+                raise exceptions.WriteFanMinimumSpeedError(logger=self.logger) from e
+
+    def read_interrupt_status(self) -> int:
+        """Reads both interrupt status registers in a single block read. Returns 
+        status register 1 as the high byte and status register 2 as the low byte."""
+        self.logger.debug("Reading interrupt status")
+
+        # Read interrupt status registers
+        with self.i2c_lock:
+            try:
+                self.i2c.write(bytes([INTERRUPT_STATUS_REGISTER_1]))
+                bytes_ = self.i2c.read(2)
+            except I2CError as e:
+                raise exceptions.ReadInterruptStatusError(logger=self.logger) from e
+
+        # Combine status bytes
+        status = (bytes_[0] << 8) + bytes_[1]
+        self.logger.debug("Interrupt status: {}".format(hex(status)))
+        return status
+
     def read_fan_speed(self, fan_id: int) -> float:
         """Reads fan speed."""
         self.logger.debug("Reading fan speed for fan {}".format(fan_id))
@@ -34,6 +34,46 @@ class DisableMonitoringError(DriverError):
     message_base = "Unable to disable monitoring"
 
 
+class EnableHighFrequencyFanDriveError(DriverError):
+    message_base = "Unable to enable high frequency fan drive"
+
+
+class EnableLowFrequencyFanDriveError(DriverError):
+    message_base = "Unable to enable low frequency fan drive"
+
+
+class WriteThermalZoneConfigError(DriverError):
+    message_base = "Unable to write thermal zone config"
+
+
+class WriteThermalZoneMinimumTemperatureError(DriverError):
+    message_base = "Unable to write thermal zone minimum temperature"
+
+
+class WriteMinDutyCycleError(DriverError):
+    message_base = "Unable to write minimum duty cycle"
+
+
+class WriteMaxDutyCycleError(DriverError):
+    message_base = "Unable to write maximum duty cycle"
+
+
+class ReadCurrentDutyCycleError(DriverError):
+    message_base = "Unable to read current duty cycle"
+
+
+class WriteCurrentDutyCycleError(DriverError):
+    message_base = "Unable to write current duty cycle"
+
+
+class WriteFanPulsesPerRevolutionError(DriverError):
+    message_base = "Unable to write fan pulses per revolution"
+
+
+class ReadTachometerError(DriverError):
+    message_base = "Unable to read tachometer"
+
+
 class ShutdownError(DriverError):
     message_base = "Unable to power down"
 
@@ -42,9 +82,25 @@ class ReadTemperatureError(DriverError):
     message_base = "Unable to read temperature"
 
 
-class ReadMaxTemperatureError(DriverError):
-    message_base = "Unable to read max temperature"
+class ReadTemperaturesError(DriverError):
+    message_base = "Unable to read temperatures"
+
+
+class ReadFanStatusError(DriverError):
+    message_base = "Unable to read fan status"
+
+
+class ReadMaximumTemperatureError(DriverError):
+    message_base = "Unable to read maximum temperature"
 
 
 class WriteTemperatureLimitsError(DriverError):
     message_base = "Unable to write temperature limits"
+
+
+class WriteFanMinimumSpeedError(DriverError):
+    message_base = "Unable to write fan minimum speed"
+
+
+class ReadInterruptStatusError(DriverError):
+    message_base = "Unable to read interrupt status"
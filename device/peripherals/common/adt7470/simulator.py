@@ -1,14 +1,11 @@
 # Import python types
 from typing import Any, Dict, Optional
 
-# Import device utilities
-from device.utilities.bitwise import byte_str
-
 # Import simulator elements
 from device.utilities.communication.i2c.peripheral_simulator import PeripheralSimulator
 
 
-class PCA9633Simulator(PeripheralSimulator):  # type: ignore
+class ADT7470Simulator(PeripheralSimulator):  # type: ignore
     """Simulates communication with peripheral."""
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
@@ -17,22 +14,25 @@ class PCA9633Simulator(PeripheralSimulator):  # type: ignore
         # Intialize parent class
         super().__init__(*args, **kwargs)
 
-        # Initialize registers and write dicts
-        self.registers: Dict = {}
-        self.writes: Dict = {}
+        # Initialize registers, all registers read back as zero until written
+        self.registers: Dict = {register: 0x00 for register in range(256)}
 
-        # Initialize port byte
-        self.port_status_byte = 0x00
+        # Initialize register pointer
+        self.register_pointer = 0x00
 
     def get_write_response_bytes(self, write_bytes: bytes) -> Optional[bytes]:
-        """Gets response byte for write command. Handles state based writes. This driver
-        will only ever write 1 byte to the device that corresponds to the port status 
-        byte."""
-        self.port_status_byte = write_bytes[0]
-        return bytes([0x00])  # TODO: Check was is returned from the hardware function
+        """Gets response bytes for write command. A single byte write sets the
+        register pointer for the following block read."""
+        if len(write_bytes) != 1:
+            return None
+        self.register_pointer = write_bytes[0]
+        return bytes([])
 
     def get_read_response_bytes(self, num_bytes: int) -> bytes:
-        """Gets response bytes from read command. Handles state based reads. This 
-        driver will only ever read 1 byte from the device. That byte corresponds to 
-        the port status byte."""
-        return bytes([self.port_status_byte])
+        """Gets response bytes from read command. Reads registers starting at the
+        register pointer and auto-increments the pointer after each byte."""
+        bytes_ = []
+        for _ in range(num_bytes):
+            bytes_.append(self.registers[self.register_pointer])
+            self.register_pointer = (self.register_pointer + 1) % 256
+        return bytes(bytes_)
@@ -11,18 +11,63 @@ sys.path.append(str(os.getenv("PROJECT_ROOT", "")))
 from device.utilities.communication.i2c.mux_simulator import MuxSimulator
 
 # Import peripheral driver
-from device.peripherals.common.adt7470.driver import PCA9633Driver
+from device.peripherals.common.adt7470.driver import ADT7470Driver
+from device.peripherals.common.adt7470 import driver as adt7470_driver
 from device.peripherals.common.adt7470 import exceptions
 
 
-def test_init() -> None:
-    driver = ADT7470Driver(
+def create_driver() -> ADT7470Driver:
+    return ADT7470Driver(
         "Test",
         i2c_lock=threading.RLock(),
         bus=2,
-        address=0x20,
+        address=0x2F,
         mux=0x77,
         channel=4,
         simulate=True,
         mux_simulator=MuxSimulator(),
     )
+
+
+def test_init() -> None:
+    driver = create_driver()
+
+
+def test_read_all_temperatures() -> None:
+    driver = create_driver()
+    registers = driver.i2c.io.registers
+    base = adt7470_driver.TEMPERATURE_BASE_REGISTER
+    temperature_bytes = [0x00, 0x19, 0x7F, 0x80, 0xFF, 0xE7, 0x01, 0x02, 0x03, 0x04]
+    for index, temperature_byte in enumerate(temperature_bytes):
+        registers[base + index] = temperature_byte
+    temperatures = driver.read_all_temperatures()
+    assert temperatures == [0.0, 25.0, 127.0, -128.0, -1.0, -25.0, 1.0, 2.0, 3.0, 4.0]
+
+
+def test_read_all_fan_status() -> None:
+    driver = create_driver()
+    registers = driver.i2c.io.registers
+
+    # Set tachometer words, low byte first: running, stopped (0xFFFF), stopped (0)
+    base = adt7470_driver.TACHOMETER_BASE_REGISTER
+    tachometer_words = [0x0546, 0xFFFF, 0x0000, 0x0A8C]
+    for fan_id, tachometer_word in enumerate(tachometer_words):
+        registers[base + 2 * fan_id] = tachometer_word & 0xFF
+        registers[base + 2 * fan_id + 1] = tachometer_word >> 8
+
+    # Set current duty cycles
+    base = adt7470_driver.PWM_CURRENT_DUTY_CYCLE_BASE_REGISTER
+    for fan_id, duty_cycle_byte in enumerate([0x00, 0x40, 0x80, 0xFF]):
+        registers[base + fan_id] = duty_cycle_byte
+
+    duty_cycles, fan_speeds = driver.read_all_fan_status()
+    assert duty_cycles == [0.0, 25.1, 50.2, 100.0]
+    assert fan_speeds == [4000.0, 0.0, 0.0, 2000.0]
+
+
+def test_read_interrupt_status() -> None:
+    driver = create_driver()
+    registers = driver.i2c.io.registers
+    registers[adt7470_driver.INTERRUPT_STATUS_REGISTER_1] = 0x01
+    registers[adt7470_driver.INTERRUPT_STATUS_REGISTER_2] = 0x10
+    assert driver.read_interrupt_status() == 0x0110
@@ -2,7 +2,7 @@
 import time, threading
 
 # Import python types
-from typing import NamedTuple, Optional, Dict
+from typing import NamedTuple, Optional, Dict, List
 
 # Import device utilities
 from device.utilities.logger import Logger
@@ -65,15 +65,30 @@ class DAC5578Driver:
         message = "Writing output on channel {} to: {:.02F}%".format(channel, percent)
         self.logger.debug(message)
 
+        # Build set output command
+        try:
+            command_bytes = self.build_output_command(channel, percent)
+        except ValueError as e:
+            raise exceptions.WriteOutputError(message=str(e), logger=self.logger)
+
+        # Send set output command to dac
+        self.logger.debug("Writing to dac: {}".format(command_bytes))
+        try:
+            self.i2c.write(bytes(command_bytes), disable_mux=disable_mux)
+        except I2CError as e:
+            raise exceptions.WriteOutputError(logger=self.logger) from e
+
+    def build_output_command(self, channel: int, percent: float) -> List[int]:
+        """Builds write and update command bytes for setting channel to output 
+        percent. Raises ValueError if channel or percent is out of range."""
+
         # Check valid channel range
         if channel < 0 or channel > 7:
-            message = "channel out of range, must be within 0-7"
-            raise exceptions.WriteOutputError(message=message, logger=self.logger)
+            raise ValueError("channel out of range, must be within 0-7")
 
         # Check valid value range
         if percent < 0 or percent > 100:
-            message = "output percent out of range, must be within 0-100"
-            raise exceptions.WriteOutputError(message=message, logger=self.logger)
+            raise ValueError("output percent out of range, must be within 0-100")
 
         # Convert output percent to byte, ensure 100% is byte 255
         if percent == 100:
@@ -81,16 +96,12 @@ class DAC5578Driver:
         else:
             byte = int(percent * 2.55)
 
-        # Send set output command to dac
-        self.logger.debug("Writing to dac: ch={}, byte={}".format(channel, byte))
-        try:
-            self.i2c.write(bytes([0x30 + channel, byte, 0x00]), disable_mux=disable_mux)
-        except I2CError as e:
-            raise exceptions.WriteOutputError(logger=self.logger) from e
+        # Return command bytes
+        return [0x30 + channel, byte, 0x00]
 
     def write_outputs(self, outputs: dict, retry: bool = True) -> None:
-        """Sets output channels to output percents. Only sets mux once. 
-        Keeps thread locked since relies on mux not changing."""
+        """Sets output channels to output percents. Sends one write command per 
+        channel back-to-back in a single i2c transaction so mux is only set once."""
         self.logger.debug("Writing outputs: {}".format(outputs))
 
         # Check output dict is not empty
@@ -103,14 +114,21 @@ class DAC5578Driver:
             message = "output dict must not contain more than 8 entries"
             raise exceptions.WriteOutputsError(message=message, logger=self.logger)
 
-        # Run through each output
+        # Build set output command for each output
+        command_bytes: List[int] = []
         for channel, percent in outputs.items():
-            message = "Writing output for ch {}: {}%".format(channel, percent)
-            self.logger.debug(message)
             try:
-                self.write_output(channel, percent, retry=retry)
-            except exceptions.WriteOutputError as e:
-                raise exceptions.WriteOutputsError(logger=self.logger) from e
+                command_bytes += self.build_output_command(channel, percent)
+            except ValueError as e:
+                message = str(e)
+                raise exceptions.WriteOutputsError(message=message, logger=self.logger)
+
+        # Send all set output commands to dac
+        self.logger.debug("Writing to dac: {}".format(command_bytes))
+        try:
+            self.i2c.write(bytes(command_bytes), retry=retry)
+        except I2CError as e:
+            raise exceptions.WriteOutputsError(logger=self.logger) from e
 
     def read_power_register(self, retry: bool = True) -> Optional[Dict[int, bool]]:
         """Reads power register."""
@@ -1,5 +1,5 @@
 # Import python types
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 # Import device utilities
 from device.utilities.bitwise import byte_str
@@ -32,3 +32,14 @@ class DAC5578Simulator(PeripheralSimulator):  # type: ignore
                 OUTPUT_WRITE_BYTES = bytes([channel, output, 0x00])
                 OUTPUT_RESPONSE_BYTES = bytes([])  # TODO
                 self.writes[byte_str(OUTPUT_WRITE_BYTES)] = OUTPUT_RESPONSE_BYTES
+
+    def get_write_response_bytes(self, write_bytes: bytes) -> Optional[bytes]:
+        """Gets response bytes for write command. Handles multiple output commands 
+        sent in a single write."""
+        if len(write_bytes) > 3 and len(write_bytes) % 3 == 0:
+            for index in range(0, len(write_bytes), 3):
+                command_bytes = write_bytes[index : index + 3]
+                if byte_str(command_bytes) not in self.writes:
+                    return None
+            return bytes([])
+        return self.writes.get(byte_str(write_bytes), None)
@@ -202,3 +202,19 @@ def test_set_high() -> None:
         mux_simulator=MuxSimulator(),
     )
     driver.set_high()
+
+
+def test_write_outputs_channel_gt() -> None:
+    driver = DAC5578Driver(
+        "Test",
+        i2c_lock=threading.RLock(),
+        bus=2,
+        address=0x4C,
+        mux=0x77,
+        channel=4,
+        simulate=True,
+        mux_simulator=MuxSimulator(),
+    )
+    with pytest.raises(WriteOutputsError):
+        outputs = {0: 0, 8: 0}
+        driver.write_outputs(outputs)
@@ -2,14 +2,45 @@
 import time, json
 
 # Import python types
-from typing import Optional, Tuple, Dict, Any
+from typing import NamedTuple, Optional, Tuple, Dict, Any, List
 
 # Import peripheral parent class
 from device.peripherals.classes.peripheral import manager, modes
 
 # Import manager elements
-from device.peripherals.common.adt7470 import driver
-from device.peripherals.modules.actuator_pca9633 import exceptions, events
+from device.peripherals.common.adt7470 import driver, exceptions
+
+# Initialize fan verification parameters
+MINIMUM_FAN_SPEED = 100  # rpm
+FAN_VERIFICATION_TIMEOUT = 5  # seconds
+FAN_VERIFICATION_POLL_INTERVAL = 0.1  # seconds
+
+# Initialize adaptive sampling parameters
+TEMPERATURE_NOISE = 0.25  # celsius
+MAXIMUM_INTERVAL_SCALE = 10
+INTERVAL_SCALE_BACKOFF = 1.5
+SAMPLING_INTERVAL_TOLERANCE = 0.5  # seconds
+
+
+class Sensor(NamedTuple):
+    """Temperature sensor parameters."""
+
+    sensor_id: int
+    variable_name: str
+
+
+class Actuator(NamedTuple):
+    """Fan actuator parameters."""
+
+    fan_id: int
+    duty_cycle_name: str
+    fan_speed_name: str
+    tachometer_enabled: bool
+    control_sensor_id: Optional[Any]
+    minimum_temperature: Optional[float]
+    minimum_duty_cycle: Optional[float]
+    maximum_duty_cycle: Optional[float]
+    drive_frequency_mode: Optional[str]
 
 
 class ControllerADT7470Manager(manager.PeripheralManager):
@@ -21,41 +52,53 @@ class ControllerADT7470Manager(manager.PeripheralManager):
         # Initialize parent class
         super().__init__(*args, **kwargs)
 
-        # Initialize sensors and actuators
-        self.sensors = self.parameters.get("sensors", [])
-        self.actuators = self.parameters.get("actuators", [])
+        # Bind state setter once since it is called on every update
+        self._name = self.name
+        self._set_reported = self.state.bulk_set_peripheral_reported
+
+        # Initialize sensors and actuators, parameters are parsed once here so update
+        # loops can use attribute access instead of repeated dict lookups
+        self.sensors = [
+            Sensor(sensor.get("sensor_id"), sensor.get("variable_name"))
+            for sensor in self.parameters.get("sensors", [])
+        ]
+        self.actuators = [
+            Actuator(
+                fan_id=actuator.get("fan_id"),
+                duty_cycle_name=actuator.get("duty_cycle_name"),
+                fan_speed_name=actuator.get("fan_speed_name"),
+                tachometer_enabled=actuator.get("tachometer_enabled", False),
+                control_sensor_id=actuator.get("control_sensor_id"),
+                minimum_temperature=actuator.get("minimum_temperature"),
+                minimum_duty_cycle=actuator.get("minimum_duty_cycle"),
+                maximum_duty_cycle=actuator.get("maximum_duty_cycle"),
+                drive_frequency_mode=actuator.get("drive_frequency_mode"),
+            )
+            for actuator in self.parameters.get("actuators", [])
+        ]
 
         # Initialize setpoints
+        sensors_by_id = {sensor.sensor_id: sensor for sensor in self.sensors}
         for actuator in self.actuators:
-            control_sensor_id = actuator.get("control_sensor_id")
-            if type(control_sensor_id) is int:
-                minimum_temperature = actuator.get("minimum_temperature")
-                for sensor in self.sensors:
-                    sensor_id = sensor.get("sensor_id")
-                    if sensor_id == control_sensor_id:
-                        variable_name = sensor.get("variable_name")
-                        value = "Less Than {}".format(minimum_temperature)
-                        self.state.set_peripheral_desired_sensor_value(
-                            self.name, variable_name, value
-                        )
-                        self.state.set_environment_desired_sensor_value(
-                            variable_name, value
-                        )
+            control_sensor_id = actuator.control_sensor_id
+            if type(control_sensor_id) is not int:
+                continue
+            control_sensor = sensors_by_id.get(control_sensor_id)
+            if control_sensor is None:
+                continue
+            variable_name = control_sensor.variable_name
+            value = "Less Than {}".format(actuator.minimum_temperature)
+            self.state.set_peripheral_desired_sensor_value(
+                self.name, variable_name, value
+            )
+            self.state.set_environment_desired_sensor_value(variable_name, value)
 
         # Set default sampling interval
         self.default_sampling_interval = 3  # seconds
-        self.prev_update = 0  # timestamp
-
-    def set_sensor(self, name: str, value: Any) -> None:
-        """Sets a sensor value in state."""
-        self.state.set_peripheral_reported_sensor_value(self.name, name, value)
-        self.state.set_environment_reported_sensor_value(self.name, name, value)
-
-    def set_actuator(self, name: str, value: Any) -> None:
-        """Sets an actuator output value in state."""
-        self.state.set_peripheral_reported_actuator_value(self.name, name, value)
-        self.state.set_environment_reported_actuator_value(name, value)
-        # self.state.set_environment_desired_actuator_value(name, value)
+        self.prev_update = 0.0  # timestamp
+        self.prev_temperatures: Optional[List[float]] = None
+        self._interval_scale = 1.0
+        self.init_key: Optional[Tuple] = None
 
     def initialize_peripheral(self) -> None:
         """Initializes manager."""
@@ -64,6 +107,12 @@ class ControllerADT7470Manager(manager.PeripheralManager):
         # Clear reported values
         self.clear_reported_values()
 
+        # Reuse existing driver if still healthy and communication is unchanged
+        init_key = (self.bus, self.mux, self.channel, self.address)
+        if init_key == self.init_key and self.health is not None and self.health > 0:
+            self.logger.debug("Driver already initialized")
+            return
+
         # Initialize health
         self.health = 100.0
 
@@ -83,8 +132,10 @@ class ControllerADT7470Manager(manager.PeripheralManager):
                 simulate=self.simulate,
                 mux_simulator=self.mux_simulator,
             )
+            self.init_key = init_key
         except exceptions.DriverError as e:
             self.logger.exception("Unable to initialize: {}".format(e))
+            self.init_key = None
             self.health = 0.0
             self.mode = modes.ERROR
 
@@ -99,56 +150,70 @@ class ControllerADT7470Manager(manager.PeripheralManager):
         try:
             # Set drive mode
             if len(self.actuators) > 0:
-                actuator = self.actuators[0]
-                drive_frequency_mode = actuator.get("drive_frequency_mode")
+                drive_frequency_mode = self.actuators[0].drive_frequency_mode
                 if drive_frequency_mode == "low":
                     self.driver.enable_low_frequency_fan_drive()
                 else:
                     self.driver.enable_high_frequency_fan_drive()
 
-            # Turn on tach enabled fans
+            # Turn on tach enabled fans and set their alarm limits
+            tach_fan_ids: List[int] = []
             for actuator in self.actuators:
-                fan_id = actuator.get("fan_id")
-                tachometer_enabled = actuator.get("tachometer_enabled")
-                if tachometer_enabled:
+                if actuator.tachometer_enabled:
+                    fan_id = actuator.fan_id
                     self.driver.enable_manual_fan_control(fan_id)
                     self.driver.write_current_duty_cycle(fan_id, 100)
+                    self.driver.write_fan_minimum_speed(fan_id, MINIMUM_FAN_SPEED)
+                    tach_fan_ids.append(fan_id)
 
             # Enable monitoring
             self.driver.enable_monitoring()
 
-            # Wait 5 seconds for fans to turn on
-            time.sleep(5)
+            # Wait for tach enabled fans to report a measured speed, tach registers
+            # read as zero speed until the first measurement so stale values can't pass
+            fan_speeds = [0.0] * driver.NUM_FANS
+            timeout = time.time() + FAN_VERIFICATION_TIMEOUT
+            while len(tach_fan_ids) > 0 and time.time() < timeout:
+                time.sleep(FAN_VERIFICATION_POLL_INTERVAL)
+                _, fan_speeds = self.driver.read_all_fan_status()
+                if all(fan_speeds[fan_id] > 0 for fan_id in tach_fan_ids):
+                    break
 
             # Verify fans with tachs work
-            for actuator in self.actuators:
-                fan_id = actuator.get("fan_id")
-                tachometer_enabled = actuator.get("tachometer_enabled")
-                if tachometer_enabled:
-                    fan_speed = self.driver.read_fan_speed(fan_id)
-                    self.logger.debug("Fan {}: Speed: {} RPM".format(fan_id, fan_speed))
-                    if fan_speed == 0:
-                        self.logger.error("Unable to verify fan {} is functional".format(fan_id))
-                        self.health = 60.0
+            for fan_id in tach_fan_ids:
+                fan_speed = fan_speeds[fan_id]
+                self.logger.debug("Fan {}: Speed: {} RPM".format(fan_id, fan_speed))
+                if fan_speed == 0:
+                    self.logger.error("Unable to verify fan {} is functional".format(fan_id))
+                    self.health = 60.0
 
             # Set fan modes and limits
             for actuator in self.actuators:
 
                 # Get actuator parameters
-                control_sensor_id = actuator.get("control_sensor_id")
-                fan_id = actuator.get("fan_id")
+                fan_id = actuator.fan_id
 
                 # Setup manual fans
-                if control_sensor_id is None:
+                if actuator.control_sensor_id is None:
                     self.driver.enable_manual_fan_control(fan_id)
 
                 # Setup automatic fans
                 else:
-                    control_sensor_id = actuator.get("control_sensor_id")
-                    minimum_temperature = actuator.get("minimum_temperature")
-                    minimum_duty_cycle = actuator.get("minimum_duty_cycle")
-                    maximum_duty_cycle = actuator.get("maximum_duty_cycle")
-                    self.driver.write_thermal_zone_config(fan_id, control_sensor_id)
+                    minimum_temperature = actuator.minimum_temperature
+                    minimum_duty_cycle = actuator.minimum_duty_cycle
+                    maximum_duty_cycle = actuator.maximum_duty_cycle
+                    if (
+                        minimum_temperature is None
+                        or minimum_duty_cycle is None
+                        or maximum_duty_cycle is None
+                    ):
+                        message = "fan {} requires minimum temperature and duty cycle limits".format(
+                            fan_id
+                        )
+                        raise exceptions.SetupError(message=message, logger=self.logger)
+                    self.driver.write_thermal_zone_config(
+                        fan_id, actuator.control_sensor_id
+                    )
                     self.driver.write_thermal_zone_minimum_temperature(
                         fan_id, minimum_temperature
                     )
@@ -163,40 +228,94 @@ class ControllerADT7470Manager(manager.PeripheralManager):
             return
 
     def update_peripheral(self) -> None:
-        """Updates peripheral by getting temperatures and fan speeds."""
+        """Updates peripheral by getting temperatures and fan speeds. Skips the full 
+        update if no alarms are latched and the last full update is recent."""
         
         # TODO: Add simulated bytes
         if self.simulate:
           return
         
         try:
-            # Update sensors
+            # Check for latched alarms before doing a full update, tolerating
+            # scheduler jitter so due updates are not skipped
+            now = time.time()
+            status = self.driver.read_interrupt_status()
+            update_delta = now - self.prev_update
+            interval = self.adaptive_sampling_interval - SAMPLING_INTERVAL_TOLERANCE
+            if status == 0 and update_delta < interval:
+                self.logger.debug("No alarms, skipping full update")
+                return
+            self.prev_update = now
+
+            # Read all temperatures and fan status in two block reads
+            temperatures = self.driver.read_all_temperatures()
+            duty_cycles, fan_speeds = self.driver.read_all_fan_status()
+
+            # Get sensor values
+            sensor_values: Dict[str, Any] = {}
             for sensor in self.sensors:
-                sensor_id = sensor.get("sensor_id")
-                variable_name = sensor.get("variable_name")
-                temperature = self.driver.read_temperature(sensor_id, reset_monitor=False)
-                self.set_sensor(variable_name, temperature)
+                sensor_values[sensor.variable_name] = temperatures[sensor.sensor_id]
 
-            # Update actuators
+            # Get actuator values
+            actuator_values: Dict[str, Any] = {}
             health = 100.0
             for actuator in self.actuators:
-                fan_id = actuator.get("fan_id")
-                duty_cycle_name = actuator.get("duty_cycle_name")
-                fan_speed_name = actuator.get("fan_speed_name")
-                tachometer_enabled = actuator.get("tachometer_enabled")
-                duty_cycle = self.driver.read_current_duty_cycle(fan_id)
-                fan_speed = self.driver.read_fan_speed(fan_id)
-                self.set_actuator(duty_cycle_name, duty_cycle)
-                self.set_actuator(fan_speed_name, fan_speed)
-                if tachometer_enabled and duty_cycle > 0 and fan_speed == 0:
+                fan_id = actuator.fan_id
+                duty_cycle = duty_cycles[fan_id]
+                fan_speed = fan_speeds[fan_id]
+                actuator_values[actuator.duty_cycle_name] = duty_cycle
+                actuator_values[actuator.fan_speed_name] = fan_speed
+                if actuator.tachometer_enabled and duty_cycle > 0 and fan_speed == 0:
                   self.logger.error("Unable to verify fan {} is functional. Duty Cycle: {}, Fan Speed: {}".format(fan_id, duty_cycle, fan_speed))
                   health = 60.0
             self.health = health
+
+            # Update sensor and actuator values in state
+            self._set_reported(self._name, sensor_values, actuator_values)
+
+            # Adapt sampling interval to how quickly temperatures are changing
+            self.update_sampling_interval(
+                [temperatures[sensor.sensor_id] for sensor in self.sensors]
+            )
         except exceptions.DriverError as e:
             self.logger.exception("Unable to update peripheral: {}".format(e))
             self.mode = modes.ERROR
             self.health = 0.0
 
+    @property
+    def adaptive_sampling_interval(self) -> float:
+        """Gets adaptive sampling interval. Scales from the user's sampling interval
+        and is never shorter than it. Only kept on the manager so the stored 
+        sampling interval is never overwritten."""
+        return self.sampling_interval * self._interval_scale
+
+    def update_sampling_interval(self, temperatures: List[float]) -> None:
+        """Backs off adaptive sampling interval while temperatures are steady and 
+        shortens it again when they change by more than sensor noise."""
+
+        # Compare against previous temperatures
+        prev_temperatures = self.prev_temperatures
+        self.prev_temperatures = temperatures
+        if prev_temperatures is None or len(temperatures) == 0:
+            return
+        max_delta = max(
+            abs(temperature - prev_temperature)
+            for temperature, prev_temperature in zip(temperatures, prev_temperatures)
+        )
+
+        # Update interval scale
+        scale = self._interval_scale
+        if max_delta < TEMPERATURE_NOISE:
+            scale = min(scale * INTERVAL_SCALE_BACKOFF, MAXIMUM_INTERVAL_SCALE)
+        else:
+            scale = max(scale / 2, 1.0)
+        if scale != self._interval_scale:
+            self._interval_scale = scale
+            message = "Adaptive sampling interval: {:.1f} seconds".format(
+                self.adaptive_sampling_interval
+            )
+            self.logger.debug(message)
+
     def reset_peripheral(self) -> None:
         """Resets sensor."""
         self.logger.info("Resetting")
@@ -216,12 +335,13 @@ class ControllerADT7470Manager(manager.PeripheralManager):
 
     def clear_reported_values(self) -> None:
         """Clears reported values."""
-        for sensor in self.sensors:
-            variable_name = sensor.get("variable_name")
-            self.set_sensor(variable_name, None)
+        self.prev_temperatures = None
+        self._interval_scale = 1.0
+        self.prev_update = 0.0
+        sensor_values = {sensor.variable_name: None for sensor in self.sensors}
+        actuator_values: Dict[str, Any] = {}
         for actuator in self.actuators:
-            duty_cycle_name = actuator.get("duty_cycle_name")
-            fan_speed_name = actuator.get("fan_speed_name")
-            self.set_actuator(duty_cycle_name, None)
-            self.set_actuator(fan_speed_name, None)
+            actuator_values[actuator.duty_cycle_name] = None
+            actuator_values[actuator.fan_speed_name] = None
+        self._set_reported(self._name, sensor_values, actuator_values)
 
@@ -1,5 +1,11 @@
 # Import standard python libraries
-import os, sys, json, threading, pytest
+import os, sys, json, time, threading, pytest
+
+# Import python types
+from typing import List, Tuple
+
+# Import test utilities
+from unittest import mock
 
 # Set system path and directory
 ROOT_DIR = str(os.getenv("PROJECT_ROOT", "."))
@@ -12,20 +18,47 @@ from device.utilities.communication.i2c.mux_simulator import MuxSimulator
 from device.utilities.state.main import State
 
 # Import peripheral manager
-from device.peripherals.modules.actuator_pcf8574.manager import IndicatorPCA9633Manager
+from device.peripherals.modules.controller_adt7470 import manager as adt7470_manager
+from device.peripherals.modules.controller_adt7470.manager import (
+    ControllerADT7470Manager,
+)
 
 # Load test config
 CONFIG_PATH = (
-    ROOT_DIR + "/device/peripherals/modules/actuator_pca9633/tests/config.json"
+    ROOT_DIR + "/device/peripherals/modules/controller_adt7470/tests/config.json"
 )
 device_config = json.load(open(CONFIG_PATH))
 peripheral_config = accessors.get_peripheral_config(
-    device_config["peripherals"], "IndicatorLEDs"
+    device_config["peripherals"], "HeatSinkFanController"
 )
 
 
-def test_init() -> None:
-    manager = IndicatorPCA9633Manager(
+class DriverStub:
+    """Stands in for the adt7470 driver so update logic can run without hardware."""
+
+    def __init__(self) -> None:
+        self.status = 0x0000
+        self.temperatures = [25.0] * 10
+        self.duty_cycles = [50.0] * 4
+        self.fan_speeds = [1200.0] * 4
+        self.num_full_updates = 0
+
+    def read_interrupt_status(self) -> int:
+        return self.status
+
+    def read_all_temperatures(self) -> List[float]:
+        self.num_full_updates += 1
+        return list(self.temperatures)
+
+    def read_all_fan_status(self) -> Tuple[List[float], List[float]]:
+        return list(self.duty_cycles), list(self.fan_speeds)
+
+    def shutdown(self) -> None:
+        pass
+
+
+def create_manager() -> ControllerADT7470Manager:
+    return ControllerADT7470Manager(
         name="Test",
         i2c_lock=threading.RLock(),
         state=State(),
@@ -35,65 +68,159 @@ def test_init() -> None:
     )
 
 
+def test_init() -> None:
+    manager = create_manager()
+
+
 def test_initialize_peripheral() -> None:
-    manager = IndicatorPCA9633Manager(
-        name="Test",
-        i2c_lock=threading.RLock(),
-        state=State(),
-        config=peripheral_config,
-        simulate=True,
-        mux_simulator=MuxSimulator(),
-    )
+    manager = create_manager()
     manager.initialize_peripheral()
 
 
 def test_setup_peripheral() -> None:
-    manager = IndicatorPCA9633Manager(
-        name="Test",
-        i2c_lock=threading.RLock(),
-        state=State(),
-        config=peripheral_config,
-        simulate=True,
-        mux_simulator=MuxSimulator(),
-    )
+    manager = create_manager()
     manager.initialize_peripheral()
     manager.setup_peripheral()
 
 
 def test_update_peripheral() -> None:
-    manager = IndicatorPCA9633Manager(
-        name="Test",
-        i2c_lock=threading.RLock(),
-        state=State(),
-        config=peripheral_config,
-        simulate=True,
-        mux_simulator=MuxSimulator(),
-    )
+    manager = create_manager()
     manager.initialize_peripheral()
     manager.update_peripheral()
 
 
 def test_reset_peripheral() -> None:
-    manager = IndicatorPCA9633Manager(
-        name="Test",
-        i2c_lock=threading.RLock(),
-        state=State(),
-        config=peripheral_config,
-        simulate=True,
-        mux_simulator=MuxSimulator(),
-    )
+    manager = create_manager()
     manager.initialize_peripheral()
     manager.reset_peripheral()
 
 
 def test_shutdown_peripheral() -> None:
-    manager = IndicatorPCA9633Manager(
-        name="Test",
-        i2c_lock=threading.RLock(),
-        state=State(),
-        config=peripheral_config,
-        simulate=True,
-        mux_simulator=MuxSimulator(),
-    )
+    manager = create_manager()
     manager.initialize_peripheral()
+    manager.driver = DriverStub()  # type: ignore
     manager.shutdown_peripheral()
+
+
+def test_initialize_peripheral_reuses_healthy_driver() -> None:
+    manager = create_manager()
+    manager.simulate = False
+    with mock.patch.object(adt7470_manager.driver, "ADT7470Driver") as Driver:
+        manager.initialize_peripheral()
+        manager.initialize_peripheral()
+    assert Driver.call_count == 1
+
+
+def test_initialize_peripheral_rebuilds_unhealthy_driver() -> None:
+    manager = create_manager()
+    manager.simulate = False
+    with mock.patch.object(adt7470_manager.driver, "ADT7470Driver") as Driver:
+        manager.initialize_peripheral()
+        manager.health = 0.0
+        manager.initialize_peripheral()
+    assert Driver.call_count == 2
+    assert manager.health == 100.0
+
+
+def test_initialize_peripheral_rebuilds_driver_on_new_communication() -> None:
+    manager = create_manager()
+    manager.simulate = False
+    with mock.patch.object(adt7470_manager.driver, "ADT7470Driver") as Driver:
+        manager.initialize_peripheral()
+        manager.channel = 2
+        manager.initialize_peripheral()
+    assert Driver.call_count == 2
+
+
+def create_updating_manager() -> Tuple[ControllerADT7470Manager, DriverStub]:
+    manager = create_manager()
+    manager.initialize_peripheral()
+    manager.simulate = False
+    driver = DriverStub()
+    manager.driver = driver  # type: ignore
+    return manager, driver
+
+
+def test_update_peripheral_first_update() -> None:
+    manager, driver = create_updating_manager()
+    manager.update_peripheral()
+    assert driver.num_full_updates == 1
+
+
+def test_update_peripheral_skips_recent_update() -> None:
+    manager, driver = create_updating_manager()
+    manager.update_peripheral()
+    manager.update_peripheral()
+    assert driver.num_full_updates == 1
+
+
+def test_update_peripheral_due_update_with_jitter() -> None:
+    manager, driver = create_updating_manager()
+    manager.update_peripheral()
+    jitter = adt7470_manager.SAMPLING_INTERVAL_TOLERANCE / 2
+    manager.prev_update = time.time() - manager.adaptive_sampling_interval + jitter
+    manager.update_peripheral()
+    assert driver.num_full_updates == 2
+
+
+def test_update_peripheral_interrupt_status_forces_update() -> None:
+    manager, driver = create_updating_manager()
+    manager.update_peripheral()
+    driver.status = 0x0010
+    manager.update_peripheral()
+    assert driver.num_full_updates == 2
+
+
+def test_update_peripheral_after_clear_reported_values() -> None:
+    manager, driver = create_updating_manager()
+    manager.update_peripheral()
+    manager.clear_reported_values()
+    manager.update_peripheral()
+    assert driver.num_full_updates == 2
+
+
+def test_update_sampling_interval_first_sample() -> None:
+    manager = create_manager()
+    manager.update_sampling_interval([25.0])
+    assert manager.prev_temperatures == [25.0]
+    assert manager.adaptive_sampling_interval == manager.sampling_interval
+
+
+def test_update_sampling_interval_backs_off_when_steady() -> None:
+    manager = create_manager()
+    manager.update_sampling_interval([25.0])
+    manager.update_sampling_interval([25.2])
+    backoff = adt7470_manager.INTERVAL_SCALE_BACKOFF
+    assert manager.adaptive_sampling_interval == manager.sampling_interval * backoff
+
+
+def test_update_sampling_interval_backs_off_to_maximum() -> None:
+    manager = create_manager()
+    for _ in range(20):
+        manager.update_sampling_interval([25.0])
+    maximum_scale = adt7470_manager.MAXIMUM_INTERVAL_SCALE
+    expected_interval = manager.sampling_interval * maximum_scale
+    assert manager.adaptive_sampling_interval == expected_interval
+
+
+def test_update_sampling_interval_halves_when_changing() -> None:
+    manager = create_manager()
+    for _ in range(20):
+        manager.update_sampling_interval([25.0])
+    manager.update_sampling_interval([26.0])
+    maximum_scale = adt7470_manager.MAXIMUM_INTERVAL_SCALE
+    expected_interval = manager.sampling_interval * maximum_scale / 2
+    assert manager.adaptive_sampling_interval == expected_interval
+    for temperature in [27.0, 28.0, 29.0, 30.0, 31.0]:
+        manager.update_sampling_interval([temperature])
+    assert manager.adaptive_sampling_interval == manager.sampling_interval
+
+
+def test_update_sampling_interval_keeps_stored_sampling_interval() -> None:
+    manager = create_manager()
+    sampling_interval = manager.sampling_interval
+    for _ in range(20):
+        manager.update_sampling_interval([25.0])
+    stored = manager.state.peripherals[manager.name]["stored"]
+    assert stored["sampling_interval"] == sampling_interval
+    assert manager.sampling_interval == sampling_interval
@@ -228,12 +228,12 @@ class LEDDAC5578Driver:
             # Append to converted outputs
             converted_outputs[number] = percent
 
+        # Scale setpoints, same for every panel
+        dac_setpoints = self.translate_setpoints(converted_outputs)
+
         # Try to set outputs on all panels
         for panel in self.panels:
 
-            # Scale setpoints
-            dac_setpoints = self.translate_setpoints(converted_outputs)
-
             # Set outputs on panel
             try:
                 panel.driver.write_outputs(dac_setpoints)  # type: ignore
@@ -279,12 +279,12 @@ class LEDDAC5578Driver:
         except Exception as e:
             raise exceptions.SetOutputError(logger=self.logger) from e
 
+        # Scale setpoint, same for every panel
+        dac_setpoint = self.translate_setpoint(par_setpoint)
+
         # Set output on all panels
         for panel in self.panels:
 
-            # Scale setpoint
-            dac_setpoint = self.translate_setpoint(par_setpoint)
-
             # Set output on panel
             try:
                 panel.driver.write_output(channel_number, dac_setpoint)  # type: ignore
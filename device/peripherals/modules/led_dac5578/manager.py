@@ -1,5 +1,5 @@
 # Import standard python modules
-import threading, time
+import logging, threading, time
 
 # Import python types
 from typing import Optional, Tuple, Dict, Any
@@ -14,6 +14,22 @@ from device.peripherals.utilities import light
 from device.peripherals.classes.peripheral import manager, modes
 from device.peripherals.modules.led_dac5578 import driver, exceptions, events
 
+# Initialize fade step sequences, built once at import rather than every fade cycle
+FADE_UP_STEPS = (0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100)
+FADE_DOWN_STEPS = FADE_UP_STEPS[::-1]
+FADE_STEP_INTERVAL = 0.1  # seconds
+
+
+def pace(deadline: float, period: float) -> float:
+    """Gets the monotonic deadline one period after the previous deadline. Resyncs 
+    to one period from now if that deadline has already passed so late steps do 
+    not run back to back."""
+    now = time.monotonic()
+    deadline += period
+    if deadline < now:
+        deadline = now + period
+    return deadline
+
 
 class LEDDAC5578Manager(manager.PeripheralManager):
     """Manages an LED driver controlled by a dac5578."""
@@ -26,6 +42,16 @@ class LEDDAC5578Manager(manager.PeripheralManager):
     prev_reinit_time: float = 0
     reinit_interval: float = 300  # seconds -> every 5 minutes
 
+    # Initialize event handlers, maps event type to pre-processing method name,
+    # processing method name, and whether the methods take the request
+    event_handlers: Dict[str, Tuple[str, str, bool]] = {
+        events.TURN_ON: ("turn_on", "_turn_on", False),
+        events.TURN_OFF: ("turn_off", "_turn_off", False),
+        events.SET_CHANNEL: ("set_channel", "_set_channel", True),
+        events.SET_SPD: ("set_spd", "_set_spd", True),
+        events.FADE: ("fade", "_fade", False),
+    }
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize light driver."""
 
@@ -408,34 +434,26 @@ class LEDDAC5578Manager(manager.PeripheralManager):
         self, request: Dict[str, Any]
     ) -> Tuple[str, int]:
         """Processes peripheral specific event."""
-        if request["type"] == events.TURN_ON:
-            return self.turn_on()
-        elif request["type"] == events.TURN_OFF:
-            return self.turn_off()
-        elif request["type"] == events.SET_CHANNEL:
-            return self.set_channel(request)
-        elif request["type"] == events.SET_SPD:
-            return self.set_spd(request)
-        elif request["type"] == events.FADE:
-            return self.fade()
-        else:
+        handler = self.event_handlers.get(request["type"])
+        if handler is None:
             return "Unknown event request type", 400
+        method_name, _, takes_request = handler
+        if takes_request:
+            return getattr(self, method_name)(request)  # type: ignore
+        return getattr(self, method_name)()  # type: ignore
 
     def check_peripheral_specific_events(self, request: Dict[str, Any]) -> None:
         """Checks peripheral specific events."""
-        if request["type"] == events.TURN_ON:
-            self._turn_on()
-        elif request["type"] == events.TURN_OFF:
-            self._turn_off()
-        elif request["type"] == events.SET_CHANNEL:
-            self._set_channel(request)
-        elif request["type"] == events.SET_SPD:
-            self._set_spd(request)
-        elif request["type"] == events.FADE:
-            self._fade()
-        else:
+        handler = self.event_handlers.get(request["type"])
+        if handler is None:
             message = "Invalid event request type in queue: {}".format(request["type"])
             self.logger.error(message)
+            return
+        _, method_name, takes_request = handler
+        if takes_request:
+            getattr(self, method_name)(request)
+        else:
+            getattr(self, method_name)()
 
     def turn_on(self) -> Tuple[str, int]:
         """Pre-processes turn on event request."""
@@ -692,8 +710,13 @@ class LEDDAC5578Manager(manager.PeripheralManager):
         if channel_name != None:
             channel_names = [channel_name]
         else:
-            channel_outputs = self.driver.build_channel_outputs(0)
-            channel_names = channel_outputs.keys()
+            channel_names = self.channel_names
+
+        # Only build step log messages if they will be reported
+        info_enabled = self.logger.is_enabled_for(logging.INFO)
+
+        # Initialize step deadline
+        deadline = time.monotonic()
 
         # Loop forever
         while True:
@@ -702,37 +725,37 @@ class LEDDAC5578Manager(manager.PeripheralManager):
             for channel_name in channel_names:
 
                 # Fade up
-                for value in range(0, 110, 10):
+                for value in FADE_UP_STEPS:
 
                     # Set driver output
-                    self.logger.info("Channel {}: {}%".format(channel_name, value))
+                    if info_enabled:
+                        self.logger.info("Channel {}: {}%".format(channel_name, value))
                     try:
                         self.driver.set_output(channel_name, value)
                     except Exception as e:
                         self.logger.exception("Unable to fade driver")
                         return
 
-                    # Check for events
-                    if not self.event_queue.empty():
+                    # Update every 100ms, return as soon as a new event arrives
+                    deadline = pace(deadline, FADE_STEP_INTERVAL)
+                    timeout = max(deadline - time.monotonic(), 0)
+                    if self.wait_for_event(timeout=timeout):
                         return
 
-                    # Update every 100ms
-                    time.sleep(0.1)
-
                 # Fade down
-                for value in range(100, -10, -10):
+                for value in FADE_DOWN_STEPS:
 
                     # Set driver output
-                    self.logger.info("Channel {}: {}%".format(channel_name, value))
+                    if info_enabled:
+                        self.logger.info("Channel {}: {}%".format(channel_name, value))
                     try:
                         self.driver.set_output(channel_name, value)
                     except Exception as e:
                         self.logger.exception("Unable to fade driver")
                         return
 
-                    # Check for events
-                    if not self.event_queue.empty():
+                    # Update every 100ms, return as soon as a new event arrives
+                    deadline = pace(deadline, FADE_STEP_INTERVAL)
+                    timeout = max(deadline - time.monotonic(), 0)
+                    if self.wait_for_event(timeout=timeout):
                         return
-
-                    # Update every 100ms
-                    time.sleep(0.1)
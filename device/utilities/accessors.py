@@ -42,16 +42,21 @@ def dictify_list(list_: List[Any], reference_dict: Dict[str, Any]) -> Dict[str,
     return dict_
 
 
+def set_nested_dict(nested_dict: Dict, keys: List, value: Any) -> None:
+    """ Sets value in nested dict. Caller is responsible for locking. """
+    for key in keys[:-1]:
+        if key not in nested_dict:
+            nested_dict[key] = {}
+        nested_dict = nested_dict[key]
+    nested_dict[keys[-1]] = value
+
+
 def set_nested_dict_safely(
     nested_dict: Dict, keys: List, value: Any, lock: threading.RLock
 ) -> None:
     """ Safely sets value in nested dict. """
     with lock:
-        for key in keys[:-1]:
-            if key not in nested_dict:
-                nested_dict[key] = {}
-            nested_dict = nested_dict[key]
-        nested_dict[keys[-1]] = value
+        set_nested_dict(nested_dict, keys, value)
 
 
 def get_nested_dict_safely(nested_dict: Dict, keys: List) -> Any:
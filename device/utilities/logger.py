@@ -17,6 +17,14 @@ class Logger:
         logger = logging.getLogger(log)
         self.logger = logging.LoggerAdapter(logger, extra)
 
+    def is_enabled_for(self, level: int) -> bool:
+        """ Checks if messages at level will be reported. Lets callers skip 
+            building messages in hot loops. Always true in test environment 
+            since messages are printed. """
+        if "pytest" in sys.modules:
+            return True
+        return self.logger.isEnabledFor(level)
+
     def debug(self, message: str) -> None:
         """ Reports standard logging debug message if in normal runtime
             environment. If in test environment, prepends message with
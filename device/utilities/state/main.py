@@ -5,7 +5,11 @@ import threading
 from typing import Any, Dict
 
 # Import device utilities
-from device.utilities.accessors import set_nested_dict_safely, get_nested_dict_safely
+from device.utilities.accessors import (
+    set_nested_dict,
+    set_nested_dict_safely,
+    get_nested_dict_safely,
+)
 
 
 class State(object):
@@ -40,6 +44,14 @@ class State(object):
         self, sensor: str, variable: str, value: Any, simple: bool = False
     ) -> None:
         """Sets reported sensor value to shared environment state."""
+        with self.lock:
+            self._set_environment_reported_sensor_value(sensor, variable, value, simple)
+
+    def _set_environment_reported_sensor_value(
+        self, sensor: str, variable: str, value: Any, simple: bool = False
+    ) -> None:
+        """Sets reported sensor value to shared environment state. Caller must hold 
+        the state lock."""
 
         # TODO: Clean this up, it is a mess...
 
@@ -78,80 +90,75 @@ class State(object):
         if value is None:
             simple = True
 
-        with self.lock:
-            # Update individual instantaneous
-            by_type = self.environment["reported_sensor_stats"]["individual"][
-                "instantaneous"
-            ]
+        # Update individual instantaneous
+        by_type = self.environment["reported_sensor_stats"]["individual"][
+            "instantaneous"
+        ]
+        if variable not in by_type:
+            by_type[variable] = {}
+        by_var = self.environment["reported_sensor_stats"]["individual"][
+            "instantaneous"
+        ][variable]
+        by_var[sensor] = value
+
+        if simple:
+            # Update simple sensor value with reported value
+            self.environment["sensor"]["reported"][variable] = value
+
+        else:
+            # Update individual average
+            by_type = self.environment["reported_sensor_stats"]["individual"]["average"]
             if variable not in by_type:
                 by_type[variable] = {}
-            by_var = self.environment["reported_sensor_stats"]["individual"][
+            if sensor not in by_type:
+                by_type[sensor] = {"value": value, "samples": 1}
+            else:
+                stored_value = by_type[sensor]["value"]
+                stored_samples = by_type[sensor]["samples"]
+                new_samples = stored_samples + 1
+                new_value = (stored_value * stored_samples + value) / new_samples
+                by_type[sensor]["value"] = new_value
+                by_type[sensor]["samples"] = new_samples
+
+            # Update group instantaneous
+            by_var_i = self.environment["reported_sensor_stats"]["individual"][
                 "instantaneous"
             ][variable]
-            by_var[sensor] = value
-
-            if simple:
-                # Update simple sensor value with reported value
-                self.environment["sensor"]["reported"][variable] = value
-
+            num_sensors = 0
+            total = 0
+            for sensor in by_var_i:
+                if by_var_i[sensor] != None:
+                    total += by_var_i[sensor]
+                    num_sensors += 1
+            new_value = total / num_sensors
+            self.environment["reported_sensor_stats"]["group"]["instantaneous"][
+                variable
+            ] = {"value": new_value, "samples": num_sensors}
+
+            # Update group average
+            by_type = self.environment["reported_sensor_stats"]["group"]["average"]
+            if variable not in by_type:
+                by_type[variable] = {"value": value, "samples": 1}
             else:
-                # Update individual average
-                by_type = self.environment["reported_sensor_stats"]["individual"][
-                    "average"
-                ]
-                if variable not in by_type:
-                    by_type[variable] = {}
-                if sensor not in by_type:
-                    by_type[sensor] = {"value": value, "samples": 1}
+                stored_value = by_type[variable]["value"]
+                stored_samples = by_type[variable]["samples"]
+                new_samples = stored_samples + 1
+
+                # Check if group average > 20 samples
+                if new_samples > 20:
+                    new_samples = 1
+                    new_value = value
                 else:
-                    stored_value = by_type[sensor]["value"]
-                    stored_samples = by_type[sensor]["samples"]
-                    new_samples = stored_samples + 1
                     new_value = (stored_value * stored_samples + value) / new_samples
-                    by_type[sensor]["value"] = new_value
-                    by_type[sensor]["samples"] = new_samples
-
-                # Update group instantaneous
-                by_var_i = self.environment["reported_sensor_stats"]["individual"][
-                    "instantaneous"
-                ][variable]
-                num_sensors = 0
-                total = 0
-                for sensor in by_var_i:
-                    if by_var_i[sensor] != None:
-                        total += by_var_i[sensor]
-                        num_sensors += 1
-                new_value = total / num_sensors
-                self.environment["reported_sensor_stats"]["group"]["instantaneous"][
-                    variable
-                ] = {"value": new_value, "samples": num_sensors}
-
-                # Update group average
-                by_type = self.environment["reported_sensor_stats"]["group"]["average"]
-                if variable not in by_type:
-                    by_type[variable] = {"value": value, "samples": 1}
-                else:
-                    stored_value = by_type[variable]["value"]
-                    stored_samples = by_type[variable]["samples"]
-                    new_samples = stored_samples + 1
-
-                    # Check if group average > 20 samples
-                    if new_samples > 20:
-                        new_samples = 1
-                        new_value = value
-                    else:
-                        new_value = (
-                            stored_value * stored_samples + value
-                        ) / new_samples
-
-                    # Update dict
-                    by_type[variable]["value"] = new_value
-                    by_type[variable]["samples"] = new_samples
-
-                # Update simple sensor value with instantaneous group value
-                self.environment["sensor"]["reported"][variable] = self.environment[
-                    "reported_sensor_stats"
-                ]["group"]["instantaneous"][variable]["value"]
+
+                # Update dict
+                by_type[variable]["value"] = new_value
+                by_type[variable]["samples"] = new_samples
+
+            # Update simple sensor value with instantaneous group value
+            self.environment["sensor"]["reported"][variable] = self.environment[
+                "reported_sensor_stats"
+            ]["group"]["instantaneous"][variable]["value"]
 
     def set_environment_desired_sensor_value(self, variable: str, value: Any) -> None:
         """Sets desired sensor value to shared environment state."""
@@ -163,9 +170,15 @@ class State(object):
         self, variable: str, value: Any
     ) -> None:
         """Sets reported actuator value to shared environment state."""
-        set_nested_dict_safely(
-            self.environment, ["actuator", "reported", variable], value, self.lock
-        )
+        with self.lock:
+            self._set_environment_reported_actuator_value(variable, value)
+
+    def _set_environment_reported_actuator_value(
+        self, variable: str, value: Any
+    ) -> None:
+        """Sets reported actuator value to shared environment state. Caller must hold 
+        the state lock."""
+        set_nested_dict(self.environment, ["actuator", "reported", variable], value)
 
     def set_environment_desired_actuator_value(self, variable: str, value: Any) -> None:
         """Sets desired actuator value to shared environment state."""
@@ -209,11 +222,16 @@ class State(object):
         self, peripheral: str, variable: str, value: Any
     ) -> None:
         """Sets reported sensor value to shared peripheral state."""
-        set_nested_dict_safely(
-            self.peripherals,
-            [peripheral, "sensor", "reported", variable],
-            value,
-            self.lock,
+        with self.lock:
+            self._set_peripheral_reported_sensor_value(peripheral, variable, value)
+
+    def _set_peripheral_reported_sensor_value(
+        self, peripheral: str, variable: str, value: Any
+    ) -> None:
+        """Sets reported sensor value to shared peripheral state. Caller must hold the 
+        state lock."""
+        set_nested_dict(
+            self.peripherals, [peripheral, "sensor", "reported", variable], value
         )
 
     def set_peripheral_desired_sensor_value(
@@ -231,11 +249,16 @@ class State(object):
         self, peripheral: str, variable: str, value: Any
     ) -> None:
         """Sets reported actuator value to shared peripheral state."""
-        set_nested_dict_safely(
-            self.peripherals,
-            [peripheral, "actuator", "reported", variable],
-            value,
-            self.lock,
+        with self.lock:
+            self._set_peripheral_reported_actuator_value(peripheral, variable, value)
+
+    def _set_peripheral_reported_actuator_value(
+        self, peripheral: str, variable: str, value: Any
+    ) -> None:
+        """Sets reported actuator value to shared peripheral state. Caller must hold the 
+        state lock."""
+        set_nested_dict(
+            self.peripherals, [peripheral, "actuator", "reported", variable], value
         )
 
     def set_peripheral_desired_actuator_value(
@@ -249,6 +272,24 @@ class State(object):
             self.lock,
         )
 
+    def bulk_set_peripheral_reported(
+        self,
+        peripheral: str,
+        sensor_values: Dict[str, Any],
+        actuator_values: Dict[str, Any],
+    ) -> None:
+        """Sets reported sensor and actuator values to shared peripheral and 
+        environment state while holding the state lock once for all values."""
+        with self.lock:
+            for variable, value in sensor_values.items():
+                self._set_peripheral_reported_sensor_value(peripheral, variable, value)
+                self._set_environment_reported_sensor_value(peripheral, variable, value)
+            for variable, value in actuator_values.items():
+                self._set_peripheral_reported_actuator_value(
+                    peripheral, variable, value
+                )
+                self._set_environment_reported_actuator_value(variable, value)
+
     def get_peripheral_reported_sensor_value(
         self, peripheral: str, variable: str
     ) -> Any:
@@ -1,5 +1,8 @@
 # Import standard python libraries
-import os, sys, pytest, threading
+import os, sys, copy, pytest, threading
+
+# Import python types
+from typing import Any, Dict
 
 # Set system path
 sys.path.append(os.environ["PROJECT_ROOT"])
@@ -16,3 +19,67 @@ from device.utilities.state.main import State
 #     assert list(s.recipe.keys()) == []
 #     assert list(s.peripherals.keys()) == []
 #     assert list(s.controllers.keys()) == []
+
+
+class CountingLock:
+    """Re-entrant lock that counts how many times it is acquired."""
+
+    def __init__(self) -> None:
+        self.lock = threading.RLock()
+        self.acquisitions = 0
+
+    def __enter__(self) -> None:
+        self.lock.acquire()
+        self.acquisitions += 1
+
+    def __exit__(self, *args: Any) -> None:
+        self.lock.release()
+
+
+def restore_state(peripherals: Dict[str, Any], environment: Dict[str, Any]) -> None:
+    """Restores class level state dicts shared by every state instance."""
+    State.peripherals.clear()
+    State.peripherals.update(peripherals)
+    State.environment.clear()
+    State.environment.update(environment)
+
+
+def test_bulk_set_peripheral_reported() -> None:
+    peripherals = copy.deepcopy(State.peripherals)
+    environment = copy.deepcopy(State.environment)
+    try:
+        state = State()
+        state.bulk_set_peripheral_reported(
+            "Test", {"temperature_celsius": 25.0}, {"fan_speed_rpm": 1200.0}
+        )
+        assert (
+            state.get_peripheral_reported_sensor_value("Test", "temperature_celsius")
+            == 25.0
+        )
+        assert (
+            state.get_environment_reported_sensor_value("temperature_celsius") == 25.0
+        )
+        assert (
+            state.get_peripheral_reported_actuator_value("Test", "fan_speed_rpm")
+            == 1200.0
+        )
+        assert state.get_environment_reported_actuator_value("fan_speed_rpm") == 1200.0
+    finally:
+        restore_state(peripherals, environment)
+
+
+def test_bulk_set_peripheral_reported_locks_once() -> None:
+    peripherals = copy.deepcopy(State.peripherals)
+    environment = copy.deepcopy(State.environment)
+    try:
+        state = State()
+        lock = CountingLock()
+        state.lock = lock  # type: ignore
+        state.bulk_set_peripheral_reported(
+            "Test",
+            {"temperature_celsius": 25.0, "humidity_percent": 40.0},
+            {"fan_speed_rpm": 1200.0, "fan_duty_cycle_percent": 50.0},
+        )
+        assert lock.acquisitions == 1
+    finally:
+        restore_state(peripherals, environment)
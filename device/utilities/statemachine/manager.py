@@ -203,6 +203,15 @@ class StateMachineManager:
         else:
             self.logger.error("Invalid event request type in queue: {}".format(type_))
 
+    def wait_for_event(self, timeout: float) -> bool:
+        """Blocks until an event is in the queue or timeout seconds pass. Does not 
+        remove the event from the queue so it is still processed by check_events. 
+        Returns true if an event is waiting."""
+        with self.event_queue.not_empty:
+            return self.event_queue.not_empty.wait_for(
+                lambda: len(self.event_queue.queue) > 0, timeout
+            )
+
     def shutdown(self) -> Tuple[str, int]:
         """Pre-processes shutdown event. Returns message and http status code."""
         self.logger.debug("Pre-processing shutdown event request")
@@ -207,6 +207,19 @@ def test_check_event_invalid_type() -> None:
     # Just checking doesn't break anything (throw exception)
 
 
+def test_wait_for_event_timeout() -> None:
+    manager = StateMachineManager()
+    assert manager.wait_for_event(timeout=0.01) == False
+
+
+def test_wait_for_event_does_not_consume_event() -> None:
+    manager = StateMachineManager()
+    request = {"type": "Junk"}
+    manager.event_queue.put(request)
+    assert manager.wait_for_event(timeout=0.01) == True
+    assert manager.event_queue.qsize() == 1
+
+
 def test_preprocess_reset_invalid_mode() -> None:
     manager = StateMachineManager()
     assert manager._mode == modes.INIT